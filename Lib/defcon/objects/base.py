@@ -542,6 +542,13 @@ class BaseDictObject(dict, BaseObject):
             self.postNotification(self.deleteItemNotificationName, data=dict(key=key))
         self.dirty = True
 
+    def pop(self, key, *args):
+        if key not in self:
+            return super(BaseDictObject, self).pop(key, *args)
+        value = self[key]
+        del self[key]
+        return value
+
     def __deepcopy__(self, memo={}):
         import copy
         obj = self.__class__()
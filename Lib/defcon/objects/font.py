@@ -1,6 +1,7 @@
 from __future__ import absolute_import
 import os
 import re
+import sys
 import tempfile
 import shutil
 from fontTools.ufoLib import UFOReader, UFOWriter, UFOLibError, UFOFileStructure, UFOFormatVersion
@@ -11,11 +12,13 @@ from defcon.objects.kerning import Kerning
 from defcon.objects.groups import Groups
 from defcon.objects.features import Features
 from defcon.objects.lib import Lib
-from defcon.objects.imageSet import ImageSet
+from defcon.objects.imageSet import ImageSet, _makeDigest
 from defcon.objects.dataSet import DataSet
 from defcon.objects.guideline import Guideline
 from defcon.tools.notifications import NotificationCenter
 from functools import partial
+from itertools import chain
+from contextlib import contextmanager
 import logging
 
 
@@ -76,26 +79,8 @@ class Font(BaseObject):
         self._dispatcher = NotificationCenter()
         self.beginSelfNotificationObservation()
 
-        if infoClass is None:
-            infoClass = Info
-        if kerningClass is None:
-            kerningClass = Kerning
-        if groupsClass is None:
-            groupsClass = Groups
-        if featuresClass is None:
-            featuresClass = Features
-        if libClass is None:
-            libClass = Lib
-        if layerSetClass is None:
-            layerSetClass = LayerSet
-        if imageSetClass is None:
-            imageSetClass = ImageSet
-        if dataSetClass is None:
-            dataSetClass = DataSet
-        if guidelineClass is None:
-            guidelineClass = Guideline
         self._unicodeDataClass = unicodeDataClass
-        self._layerSetClass = layerSetClass
+        self._layerSetClass = layerSetClass or LayerSet
         self._layerClass = layerClass
         self._glyphClass = glyphClass
         self._glyphContourClass = glyphContourClass
@@ -103,14 +88,14 @@ class Font(BaseObject):
         self._glyphComponentClass = glyphComponentClass
         self._glyphAnchorClass = glyphAnchorClass
         self._glyphImageClass = glyphImageClass
-        self._kerningClass = kerningClass
-        self._infoClass = infoClass
-        self._groupsClass = groupsClass
-        self._featuresClass = featuresClass
-        self._libClass = libClass
-        self._guidelineClass = guidelineClass
-        self._imageSetClass = imageSetClass
-        self._dataSetClass = dataSetClass
+        self._kerningClass = kerningClass or Kerning
+        self._infoClass = infoClass or Info
+        self._groupsClass = groupsClass or Groups
+        self._featuresClass = featuresClass or Features
+        self._libClass = libClass or Lib
+        self._guidelineClass = guidelineClass or Guideline
+        self._imageSetClass = imageSetClass or ImageSet
+        self._dataSetClass = dataSetClass or DataSet
 
         self._path = path
         self._ufoFormatVersion = None
@@ -122,6 +107,7 @@ class Font(BaseObject):
         self._features = None
         self._lib = None
         self._tempLib = None
+        self._reverseGlyphOrder = None
         self._kerningGroupConversionRenameMaps = None
 
         self._layers = self.instantiateLayerSet()
@@ -192,7 +178,7 @@ class Font(BaseObject):
         # close file systems
         if self._reader is not None:
             self._reader.close()
-            del self._reader
+            self._reader = None
         for layer in self.layers:
             if layer._glyphSet is not None:
                 layer._glyphSet.close()
@@ -203,6 +189,19 @@ class Font(BaseObject):
     def __exit__(self, exc_type, exc_value, exc_tb):
         self.close()
 
+    @contextmanager
+    def _openReader(self):
+        # share the reader opened when the font was loaded with the
+        # lazy sub-object loaders. a zip is read from a snapshot of
+        # the archive that goes stale if the file is rewritten, so
+        # those still get a fresh reader every time.
+        reader = self._reader
+        if reader is not None and reader.fileStructure == UFOFileStructure.PACKAGE:
+            yield reader
+        else:
+            with UFOReader(self._path, validate=False) as reader:
+                yield reader
+
     def _get_dispatcher(self):
         return self._dispatcher
 
@@ -236,8 +235,7 @@ class Font(BaseObject):
         return self._glyphSet.insertGlyph(glyph, name=name)
 
     def __iter__(self):
-        for name in self._glyphSet.keys():
-            yield self._glyphSet[name]
+        return iter(self._glyphSet)
 
     def __getitem__(self, name):
         return self._glyphSet[name]
@@ -283,6 +281,10 @@ class Font(BaseObject):
             )
         # the file must already exist
         assert os.path.exists(path)
+        # the reader opened from the old path no longer describes
+        # this font. it is not closed since the layers still use it.
+        if path != self._path:
+            self._reader = None
         self._path = path
 
     path = property(_get_path, _set_path, doc="The location of the file on disk. Setting the path should only be done when the user has moved the file in the OS interface. Setting the path is not the same as a save operation.")
@@ -336,7 +338,7 @@ class Font(BaseObject):
     def _get_componentReferences(self):
         return self._glyphSet.componentReferences
 
-    componentReferences = property(_get_componentReferences, doc="A dict of describing the component relationships in the font's main layer. The dictionary is of form ``{base glyph : [references]}``.")
+    componentReferences = property(_get_componentReferences, doc="A dict of describing the component relationships in the font's main layer. The dictionary is of form ``{base glyph : [references]}``. The mapping is read-only.")
 
     def _get_bounds(self):
         return self._glyphSet.bounds
@@ -420,7 +422,7 @@ class Font(BaseObject):
                 # and bookkeep dirty
                 dirty = self.dirty
                 self.disableNotifications()
-                with UFOReader(self._path, validate=False) as reader:
+                with self._openReader() as reader:
                     self._info.disableNotifications()
                     reader.readInfo(self._info, validate=self._info.ufoLibReadValidate)
                     self._info.dirty = False
@@ -439,7 +441,7 @@ class Font(BaseObject):
 
     def _loadKerningAndGroups(self):
         # read
-        with UFOReader(self._path, validate=False) as reader:
+        with self._openReader() as reader:
             # instantiate everything and store it if valid
             self._groups = self.instantiateGroups()
             self.beginSelfGroupsNotificationObservation()
@@ -450,6 +452,8 @@ class Font(BaseObject):
             groups = reader.readGroups(validate=self._groups.ufoLibReadValidate)
             # Note: the incoming kerning data has not been validated.
             # Gremlins may be sneaking in through here.
+            kerning = _internKerning(kerning)
+            groups = _internGroups(groups)
             ## store groups
             self._groups.disableNotifications()
             self._groups.update(groups)
@@ -551,7 +555,7 @@ class Font(BaseObject):
             self.beginSelfFeaturesNotificationObservation()
             reader = None
             if self._path is not None:
-                with UFOReader(self._path, validate=False) as reader:
+                with self._openReader() as reader:
                     self._features.disableNotifications()
                     t = reader.readFeatures()
                     self._features.text = t
@@ -589,7 +593,7 @@ class Font(BaseObject):
             self.beginSelfLibNotificationObservation()
             reader = None
             if self._path is not None:
-                with UFOReader(self._path, validate=False) as reader:
+                with self._openReader() as reader:
                     self._lib.disableNotifications()
                     d = reader.readLib(validate=self._lib.ufoLibReadValidate)
                     self._lib.update(d)
@@ -683,6 +687,39 @@ class Font(BaseObject):
             self.lib["public.glyphOrder"] = value
         self.postNotification("Font.GlyphOrderChanged", data=dict(oldValue=oldValue, newValue=value))
 
+    def _getReverseGlyphOrder(self):
+        # the list in the lib can be replaced or edited in place,
+        # so the map is kept with a snapshot of the list it was
+        # built from and rebuilt when the two no longer match.
+        # comparing the lists is much cheaper than a rebuild.
+        order = self.lib.get("public.glyphOrder")
+        cache = self._reverseGlyphOrder
+        if cache is None or cache[0] != order:
+            reverseGlyphOrder = {}
+            if order is not None:
+                for index, glyphName in enumerate(order):
+                    reverseGlyphOrder.setdefault(glyphName, index)
+                order = order[:]
+            cache = self._reverseGlyphOrder = (order, reverseGlyphOrder)
+        return cache[1]
+
+    def getGlyphIndex(self, name):
+        """
+        Get the index of **name** in the glyph order.
+        If the glyph name is not in the glyph order,
+        None will be returned.
+        """
+        return self._getReverseGlyphOrder().get(name)
+
+    def getGlyphIndexes(self, names):
+        """
+        Get a list of the glyph order indexes for the glyph
+        names in **names**. None will be given for any glyph
+        name that is not in the glyph order.
+        """
+        reverseGlyphOrder = self._getReverseGlyphOrder()
+        return [reverseGlyphOrder.get(name) for name in names]
+
     glyphOrder = property(_get_glyphOrder, _set_glyphOrder, doc="The font's glyph order. When setting the value must be a list of glyph names. There is no requirement, nor guarantee, that the list will contain only names of glyphs in the font. Setting this posts *Font.GlyphOrderChanged* and *Font.Changed* notifications.")
 
     def updateGlyphOrder(self, addedGlyph=None, removedGlyph=None):
@@ -817,13 +854,19 @@ class Font(BaseObject):
         # if destination is an existing path, ensure matches the desired structure
         isExistingOSPath = os.path.exists(path)
         if isExistingOSPath:
-            try:
-                with UFOReader(path, validate=True) as reader:
-                    existingStructure = reader.fileStructure
-            except UFOLibError:
-                # destination is an existing file but not a valid UFO, we'll
-                # silently overwrite it. Perhaps we should blow up...
-                saveAs = True
+            reader = self._reader
+            if not saveAs and reader is not None:
+                # saving in-place, the reader that is already open
+                # for this font knows the existing structure
+                existingStructure = reader.fileStructure
+            else:
+                try:
+                    with UFOReader(path, validate=True) as reader:
+                        existingStructure = reader.fileStructure
+                except UFOLibError:
+                    # destination is an existing file but not a valid UFO, we'll
+                    # silently overwrite it. Perhaps we should blow up...
+                    saveAs = True
             if not saveAs and structure and structure is not existingStructure:
                 from defcon.errors import DefconError
                 raise DefconError(
@@ -880,15 +923,17 @@ class Font(BaseObject):
                     )
                 else:
                     raise
-            # if changing ufo format versions, flag all objects
-            # as dirty so that they will be saved
+            # if changing ufo format versions, flag all loaded objects
+            # as dirty so that they will be saved. changing the format
+            # always results in a "save as", so objects that have not
+            # been loaded yet will be loaded and written regardless.
             if self._ufoFormatVersion != formatVersion:
-                self.info.dirty = True
-                self.groups.dirty = True
-                self.kerning.dirty = True
-                self.lib.dirty = True
+                objects = [self._info, self._groups, self._kerning, self._lib]
                 if formatVersion > UFOFormatVersion.FORMAT_1_0:
-                    self.features.dirty = True
+                    objects.append(self._features)
+                for obj in objects:
+                    if obj is not None:
+                        obj.dirty = True
             # set the kerning group remap if necessary
             if formatVersion < UFOFormatVersion.FORMAT_3_0 and self._kerningGroupConversionRenameMaps is not None:
                 writer.setKerningGroupConversionRenameMaps(self._kerningGroupConversionRenameMaps)
@@ -927,12 +972,14 @@ class Font(BaseObject):
         self.layers._fontSaveWasCompleted()
 
     def _saveInfo(self, writer, saveAs=False, progressBar=None):
-        # info should always be saved
-        if progressBar is not None:
-            progressBar.update(text="Saving info...", increment=0)
-        self.saveInfo(writer)
-        self.info.dirty = False
-        self._stampInfoDataState(writer)
+        # info should always be saved. when saving in place, info
+        # that has never been loaded still matches the file on disk.
+        if saveAs or self._info is not None:
+            if progressBar is not None:
+                progressBar.update(text="Saving info...", increment=0)
+            self.saveInfo(writer)
+            self.info.dirty = False
+            self._stampInfoDataState(writer)
         if progressBar is not None:
             progressBar.update()
 
@@ -944,12 +991,13 @@ class Font(BaseObject):
         writer.writeInfo(self.info, validate=self.info.ufoLibWriteValidate)
 
     def _saveGroups(self, writer, saveAs=False, progressBar=None):
-        # groups should always be saved
-        if progressBar is not None:
-            progressBar.update(text="Saving groups...", increment=0)
-        self.saveGroups(writer)
-        self.groups.dirty = False
-        self._stampGroupsDataState(writer)
+        # groups should always be saved, see _saveInfo
+        if saveAs or self._groups is not None:
+            if progressBar is not None:
+                progressBar.update(text="Saving groups...", increment=0)
+            self.saveGroups(writer)
+            self.groups.dirty = False
+            self._stampGroupsDataState(writer)
         if progressBar is not None:
             progressBar.update()
 
@@ -961,7 +1009,8 @@ class Font(BaseObject):
         writer.writeGroups(self.groups, validate=self.groups.ufoLibWriteValidate)
 
     def _saveKerning(self, writer, saveAs=False, progressBar=None):
-        if self.kerning.dirty or saveAs:
+        # don't load kerning only to find that it isn't dirty
+        if saveAs or (self._kerning is not None and self._kerning.dirty):
             if progressBar is not None:
                 progressBar.update(text="Saving kerning...", increment=0)
             self.saveKerning(writer)
@@ -978,7 +1027,8 @@ class Font(BaseObject):
         writer.writeKerning(self.kerning, validate=self.kerning.ufoLibWriteValidate)
 
     def _saveFeatures(self, writer, saveAs=False, progressBar=None):
-        if self.features.dirty or saveAs:
+        # don't load features only to find that they aren't dirty
+        if saveAs or (self._features is not None and self._features.dirty):
             if progressBar is not None:
                 progressBar.update(text="Saving features...", increment=0)
             if self.features.text is not None:
@@ -996,12 +1046,13 @@ class Font(BaseObject):
         writer.writeFeatures(self.features.text, validate=self.features.ufoLibWriteValidate)
 
     def _saveLib(self, writer, saveAs=False, progressBar=None):
-        # lib should always be saved
-        if progressBar is not None:
-            progressBar.update(text="Saving lib...", increment=0)
-        self.saveLib(writer)
-        self.lib.dirty = False
-        self._stampLibDataState(writer)
+        # lib should always be saved, see _saveInfo
+        if saveAs or self._lib is not None:
+            if progressBar is not None:
+                progressBar.update(text="Saving lib...", increment=0)
+            self.saveLib(writer)
+            self.lib.dirty = False
+            self._stampLibDataState(writer)
         if progressBar is not None:
             progressBar.update()
 
@@ -1013,10 +1064,11 @@ class Font(BaseObject):
         # if making format version 1, do some
         # temporary down conversion before
         # passing the lib to the writer
-        libCopy = dict(self.lib)
+        lib = self.lib
         if writer.formatVersionTuple == UFOFormatVersion.FORMAT_1_0:
-            self._convertToFormatVersion1RoboFabData(libCopy)
-        writer.writeLib(libCopy, validate=self.lib.ufoLibWriteValidate)
+            lib = dict(lib)
+            self._convertToFormatVersion1RoboFabData(lib)
+        writer.writeLib(lib, validate=self.lib.ufoLibWriteValidate)
 
     def saveImages(self, writer, removeUnreferencedImages=False, saveAs=False, progressBar=None):
         """
@@ -1220,22 +1272,13 @@ class Font(BaseObject):
 
     def _glyphDeletedNotificationCallback(self, notification):
         name = notification.data["name"]
-        stillExists = False
-        for layer in self.layers:
-            if name in layer:
-                stillExists = True
-                break
-        if not stillExists:
+        if not any(name in layer for layer in self._layers):
             self.updateGlyphOrder(removedGlyph=name)
 
     def _glyphRenamedNotificationCallback(self, notification):
         oldName = notification.data["oldValue"]
         newName = notification.data["newValue"]
-        oldStillExists = False
-        for layer in self.layers:
-            if oldName in layer:
-                oldStillExists = True
-                break
+        oldStillExists = any(oldName in layer for layer in self._layers)
         removedGlyph = oldName if not oldStillExists else None
         self.updateGlyphOrder(addedGlyph=newName, removedGlyph=removedGlyph)
 
@@ -1267,9 +1310,10 @@ class Font(BaseObject):
         if modTime is None:
             data = None
             modTime = -1
-        # get the data
+        # get the data. only a digest is kept, it is all
+        # that is needed to detect external changes.
         else:
-            data = reader.readBytesFromPath(fileName)
+            data = _makeDigest(reader.readBytesFromPath(fileName))
         # store the data
         obj._dataOnDisk = data
         obj._dataOnDiskTimeStamp = modTime
@@ -1351,10 +1395,10 @@ class Font(BaseObject):
             if self._data is not None:
                 modifiedData, addedData, deletedData = self._data.testForExternalChanges(reader)
         # deprecated stuff
-        defaultLayerName = self.layers.defaultLayer.name
-        modifiedGlyphs = layerChanges["modified"].get(defaultLayerName, {}).get("modified")
-        addedGlyphs = layerChanges["modified"].get(defaultLayerName, {}).get("added")
-        deletedGlyphs = layerChanges["modified"].get(defaultLayerName, {}).get("deleted")
+        defaultLayerChanges = layerChanges["modified"].get(self._glyphSet.name, {})
+        modifiedGlyphs = defaultLayerChanges.get("modified")
+        addedGlyphs = defaultLayerChanges.get("added")
+        deletedGlyphs = defaultLayerChanges.get("deleted")
         return dict(
             info=infoChanged,
             kerning=kerningChanged,
@@ -1402,7 +1446,7 @@ class Font(BaseObject):
         # time stamp mismatch
         elif modTime != obj._dataOnDiskTimeStamp:
             data = reader.readBytesFromPath(fileName)
-            if data != obj._dataOnDisk:
+            if _makeDigest(data) != obj._dataOnDisk:
                 result = True
         if closeReader:
             reader.close()
@@ -1431,31 +1475,18 @@ class Font(BaseObject):
         Reload the data in the :class:`Info` object from the
         fontinfo.plist file in the UFO.
         """
-        from fontTools.ufoLib import deprecatedFontInfoAttributesVersion2
         if self._info is None:
             obj = self.info
         else:
-            with UFOReader(self.path, validate=False) as reader:
+            with self._openReader() as reader:
                 newInfo = Info()
                 reader.readInfo(newInfo, validate=self._info.ufoLibReadValidate)
                 oldInfo = self._info
-                for attr in dir(newInfo):
-                    if attr in deprecatedFontInfoAttributesVersion2:
-                        continue
-                    if attr.startswith("_"):
-                        continue
-                    if attr == "dirty":
-                        continue
-                    if attr == "dispatcher":
-                        continue
-                    if attr == "font":
-                        continue
-                    if not hasattr(oldInfo, attr):
-                        continue
+                # only the fontinfo values are copied over. walking
+                # dir() also picked up the bound methods of newInfo.
+                for attr in Info._properties:
                     newValue = getattr(newInfo, attr)
                     oldValue = getattr(oldInfo, attr)
-                    if hasattr(newValue, "im_func"):
-                        continue
                     if oldValue == newValue:
                         continue
                     setattr(oldInfo, attr, newValue)
@@ -1473,12 +1504,18 @@ class Font(BaseObject):
         if self._kerning is None:
             obj = self.kerning
         else:
+            # kerning and groups from a UFO 1 or 2 are converted as
+            # a pair and cached by the reader, so use a fresh one.
             with UFOReader(self._path, validate=False) as reader:
                 kerning = reader.readKerning(validate=self._kerning.ufoLibReadValidate)
                 # Note: the incoming kerning data has not been validated.
                 # Gremlins may be sneaking in through here.
-                self._kerning.clear()
-                self._kerning.update(kerning)
+                kerning = _internKerning(kerning)
+                # don't clear and refill unchanged data, that
+                # would post notifications and flag it dirty.
+                if kerning != self._kerning:
+                    self._kerning.clear()
+                    self._kerning.update(kerning)
                 self._stampKerningDataState(reader)
 
     def reloadGroups(self):
@@ -1489,10 +1526,12 @@ class Font(BaseObject):
         if self._groups is None:
             obj = self.groups
         else:
+            # see reloadKerning
             with UFOReader(self._path, validate=False) as reader:
-                d = reader.readGroups(validate=self._groups.ufoLibReadValidate)
-                self._groups.clear()
-                self._groups.update(d)
+                d = _internGroups(reader.readGroups(validate=self._groups.ufoLibReadValidate))
+                if d != self._groups:
+                    self._groups.clear()
+                    self._groups.update(d)
                 self._stampGroupsDataState(reader)
 
     def reloadFeatures(self):
@@ -1503,7 +1542,7 @@ class Font(BaseObject):
         if self._features is None:
             obj = self.features
         else:
-            with UFOReader(self._path, validate=False) as reader:
+            with self._openReader() as reader:
                 text = reader.readFeatures()
                 self._features.text = text
                 self._stampFeaturesDataState(reader)
@@ -1516,10 +1555,11 @@ class Font(BaseObject):
         if self._lib is None:
             obj = self.lib
         else:
-            with UFOReader(self._path, validate=False) as reader:
+            with self._openReader() as reader:
                 d = reader.readLib(validate=self._lib.ufoLibReadValidate)
-                self._lib.clear()
-                self._lib.update(d)
+                if d != self._lib:
+                    self._lib.clear()
+                    self._lib.update(d)
                 self._stampLibDataState(reader)
 
     def reloadImages(self, fileNames):
@@ -1586,64 +1626,60 @@ class Font(BaseObject):
     # UFO Format Version Conversion
     # -----------------------------
 
+    # info attributes and the RoboFab hint data keys they map to
+    _roboFabHintDataPairs = (
+        ("postscriptBlueFuzz", "blueFuzz"),
+        ("postscriptBlueScale", "blueScale"),
+        ("postscriptBlueShift", "blueShift"),
+        ("postscriptForceBold", "forceBold"),
+        ("postscriptStemSnapV", "vStems"),
+        ("postscriptStemSnapH", "hStems"),
+    )
+    _roboFabBluePairs = (
+        ("postscriptBlueValues", "blueValues"),
+        ("postscriptOtherBlues", "otherBlues"),
+        ("postscriptFamilyBlues", "familyBlues"),
+        ("postscriptFamilyOtherBlues", "familyOtherBlues"),
+    )
+    _roboFabLibKeys = frozenset([
+        "org.robofab.opentype.classes",
+        "org.robofab.opentype.features",
+        "org.robofab.opentype.featureorder",
+        "org.robofab.postScriptHintData",
+    ])
+
     def _convertFromFormatVersion1RoboFabData(self):
+        # nothing to migrate
+        if self.lib.keys().isdisjoint(self._roboFabLibKeys):
+            return
         # migrate features from the lib
         features = []
-        classes = self.lib.get("org.robofab.opentype.classes")
+        classes = self.lib.pop("org.robofab.opentype.classes", None)
         if classes is not None:
-            del self.lib["org.robofab.opentype.classes"]
             features.append(classes)
-        splitFeatures = self.lib.get("org.robofab.opentype.features")
+        splitFeatures = self.lib.pop("org.robofab.opentype.features", None)
         if splitFeatures is not None:
-            order = self.lib.get("org.robofab.opentype.featureorder")
+            order = self.lib.pop("org.robofab.opentype.featureorder", None)
             if order is None:
-                order = sorted(splitFeatures.keys())
-            else:
-                del self.lib["org.robofab.opentype.featureorder"]
-            del self.lib["org.robofab.opentype.features"]
+                order = sorted(splitFeatures)
             for tag in order:
                 oneFeature = splitFeatures.get(tag)
                 if oneFeature is not None:
                     features.append(oneFeature)
         self.features.text = "\n".join(features)
         # migrate hint data from the lib
-        hintData = self.lib.get("org.robofab.postScriptHintData")
+        hintData = self.lib.pop("org.robofab.postScriptHintData", None)
         if hintData is not None:
-            del self.lib["org.robofab.postScriptHintData"]
-            # settings
-            blueFuzz = hintData.get("blueFuzz")
-            if blueFuzz is not None:
-                self.info.postscriptBlueFuzz = blueFuzz
-            blueScale = hintData.get("blueScale")
-            if blueScale is not None:
-                self.info.postscriptBlueScale = blueScale
-            blueShift = hintData.get("blueShift")
-            if blueShift is not None:
-                self.info.postscriptBlueShift = blueShift
-            forceBold = hintData.get("forceBold")
-            if forceBold is not None:
-                self.info.postscriptForceBold = forceBold
-            # stems
-            vStems = hintData.get("vStems")
-            if vStems is not None:
-                self.info.postscriptStemSnapV = vStems
-            hStems = hintData.get("hStems")
-            if hStems is not None:
-                self.info.postscriptStemSnapH = hStems
+            # settings and stems
+            for infoAttr, libKey in self._roboFabHintDataPairs:
+                value = hintData.get(libKey)
+                if value is not None:
+                    setattr(self.info, infoAttr, value)
             # blues
-            bluePairs = [
-                ("postscriptBlueValues", "blueValues"),
-                ("postscriptOtherBlues", "otherBlues"),
-                ("postscriptFamilyBlues", "familyBlues"),
-                ("postscriptFamilyOtherBlues", "familyOtherBlues"),
-            ]
-            for infoAttr, libKey in bluePairs:
+            for infoAttr, libKey in self._roboFabBluePairs:
                 libValue = hintData.get(libKey)
                 if libValue is not None:
-                    value = []
-                    for i, j in libValue:
-                        value.append(i)
-                        value.append(j)
+                    value = list(chain.from_iterable(libValue))
                     setattr(self.info, infoAttr, value)
 
     featureRE = re.compile(
@@ -1699,37 +1735,21 @@ class Font(BaseObject):
             libCopy["org.robofab.opentype.classes"] = classes.strip() + "\n"
         if features:
             featureDict = {}
+            featureOrder = []
             for featureName, featureText in features:
                 featureDict[featureName] = featureText.strip() + "\n"
+                featureOrder.append(featureName)
             libCopy["org.robofab.opentype.features"] = featureDict
-            libCopy["org.robofab.opentype.featureorder"] = [featureName for featureName, featureText in features]
+            libCopy["org.robofab.opentype.featureorder"] = featureOrder
         # hint data
-        hintData = dict(
-            blueFuzz=self.info.postscriptBlueFuzz,
-            blueScale=self.info.postscriptBlueScale,
-            blueShift=self.info.postscriptBlueShift,
-            forceBold=self.info.postscriptForceBold,
-            vStems=self.info.postscriptStemSnapV,
-            hStems=self.info.postscriptStemSnapH
-        )
-        bluePairs = [
-            ("postscriptBlueValues", "blueValues"),
-            ("postscriptOtherBlues", "otherBlues"),
-            ("postscriptFamilyBlues", "familyBlues"),
-            ("postscriptFamilyOtherBlues", "familyOtherBlues"),
-        ]
-        for infoAttr, libKey in bluePairs:
+        hintData = {libKey: getattr(self.info, infoAttr) for infoAttr, libKey in self._roboFabHintDataPairs}
+        for infoAttr, libKey in self._roboFabBluePairs:
             values = getattr(self.info, infoAttr)
             if values is not None:
-                finalValues = []
-                for value in values:
-                    if not finalValues or len(finalValues[-1]) == 2:
-                        finalValues.append([])
-                    finalValues[-1].append(value)
-                hintData[libKey] = finalValues
-        for key, value in list(hintData.items()):
-            if value is None:
-                del hintData[key]
+                values = list(values)
+                # an odd trailing value is kept as a pair of one
+                hintData[libKey] = [values[i:i + 2] for i in range(0, len(values), 2)]
+        hintData = {key: value for key, value in hintData.items() if value is not None}
         libCopy["org.robofab.postScriptHintData"] = hintData
 
     # -----------------------------
@@ -1831,6 +1851,24 @@ def samepath(p1, p2):
     )
 
 
+def _internKerning(kerning):
+    # the same glyph and group names are repeated across
+    # thousands of pairs, share one string object for each.
+    intern = sys.intern
+    return {(intern(first), intern(second)): value for (first, second), value in kerning.items()}
+
+def _internGroups(groups):
+    # the data may not have been validated, leave anything
+    # that isn't a list of names as it is.
+    intern = sys.intern
+    internedGroups = {}
+    for groupName, glyphNames in groups.items():
+        if isinstance(glyphNames, list):
+            glyphNames = [intern(glyphName) if isinstance(glyphName, str) else glyphName for glyphName in glyphNames]
+        internedGroups[intern(groupName)] = glyphNames
+    return internedGroups
+
+
 if __name__ == "__main__":
     import doctest
     doctest.testmod()
@@ -1,12 +1,15 @@
 from __future__ import absolute_import
 import weakref
 from fontTools.ufoLib import UFOFileStructure
-from fontTools.misc.arrayTools import unionRect
 from defcon.objects.base import BaseObject
 from defcon.objects.glyph import Glyph
 from defcon.objects.lib import Lib
 from defcon.objects.uniData import UnicodeData
 from defcon.objects.color import Color
+from defcon.objects.imageSet import _makeDigest
+from defcon.tools.representations import layerBoundsRepresentationFactory,\
+    layerControlPointBoundsRepresentationFactory,\
+    layerComponentReferencesRepresentationFactory
 from functools import partial
 
 
@@ -52,7 +55,20 @@ class Layer(BaseObject):
     """
 
     changeNotificationName = "Layer.Changed"
-    representationFactories = {}
+    representationFactories = {
+        "defcon.layer.bounds" : dict(
+            factory=layerBoundsRepresentationFactory,
+            destructiveNotifications=("Layer.Changed")
+        ),
+        "defcon.layer.controlPointBounds" : dict(
+            factory=layerControlPointBoundsRepresentationFactory,
+            destructiveNotifications=("Layer.Changed")
+        ),
+        "defcon.layer.componentReferences" : dict(
+            factory=layerComponentReferencesRepresentationFactory,
+            destructiveNotifications=("Layer.Changed")
+        ),
+    }
 
     def __init__(self, layerSet=None, glyphSet=None, libClass=None, unicodeDataClass=None,
                 guidelineClass=None, glyphClass=None,
@@ -240,8 +256,9 @@ class Layer(BaseObject):
     # -------------
 
     def __iter__(self):
-        # this is a value iterator, unlike dict()
-        for name in self.keys():
+        # this is a value iterator, unlike dict(). iterate over a
+        # copy of the names so that glyphs can be removed in the loop.
+        for name in list(self.keys()):
             yield self[name]
 
     def __getitem__(self, name):
@@ -277,7 +294,8 @@ class Layer(BaseObject):
         return len(self.keys())
 
     def __contains__(self, name):
-        return name in self.keys()
+        # keys() builds a new set while deletions are pending
+        return name in self._keys and name not in self._scheduledForDeletion
 
     def keys(self):
         """
@@ -358,6 +376,9 @@ class Layer(BaseObject):
     # component references
 
     def _get_componentReferences(self):
+        return self.getRepresentation("defcon.layer.componentReferences")
+
+    def _findComponentReferences(self):
         found = {}
         # scan loaded glyphs
         for glyphName, glyph in self._glyphs.items():
@@ -380,7 +401,7 @@ class Layer(BaseObject):
                     found[baseGlyph].add(glyphName)
         return found
 
-    componentReferences = property(_get_componentReferences, doc="A dict of describing the component relationships in the layer. The dictionary is of form ``{base glyph : [references]}``.")
+    componentReferences = property(_get_componentReferences, doc="A dict of describing the component relationships in the layer. The dictionary is of form ``{base glyph : [references]}``. The mapping is read-only.")
 
     # image references
 
@@ -410,32 +431,14 @@ class Layer(BaseObject):
     # bounds
 
     def _get_bounds(self):
-        fontRect = None
-        for glyph in self:
-            glyphRect = glyph.bounds
-            if glyphRect is None:
-                continue
-            if fontRect is None:
-                fontRect = glyphRect
-            else:
-                fontRect = unionRect(fontRect, glyphRect)
-        return fontRect
+        return self.getRepresentation("defcon.layer.bounds")
 
     bounds = property(_get_bounds, doc="The bounds of all glyphs in the layer. This can be an expensive operation.")
 
     # control point bounds
 
     def _get_controlPointBounds(self):
-        fontRect = None
-        for glyph in self:
-            glyphRect = glyph.controlPointBounds
-            if glyphRect is None:
-                continue
-            if fontRect is None:
-                fontRect = glyphRect
-            else:
-                fontRect = unionRect(fontRect, glyphRect)
-        return fontRect
+        return self.getRepresentation("defcon.layer.controlPointBounds")
 
     controlPointBounds = property(_get_controlPointBounds, doc="The control bounds of all glyphs in the layer. This only measures the point positions, it does not measure curves. So, curves without points at the extrema will not be properly measured. This is an expensive operation.")
 
@@ -593,8 +596,9 @@ class Layer(BaseObject):
         if glyphName not in glyphSet.contents:
             return
         modTime = glyphSet.getGLIFModificationTime(glyphName)
-        text = glyphSet.getGLIF(glyphName)
-        glyph._dataOnDisk = text
+        # keep a digest rather than the GLIF text of every loaded glyph
+        data = _makeDigest(glyphSet.getGLIF(glyphName))
+        glyph._dataOnDisk = data
         glyph._dataOnDiskTimeStamp = modTime
 
     def testForExternalChanges(self, reader):
@@ -606,11 +610,16 @@ class Layer(BaseObject):
         if glyphSet is None:
             return [], [], []
         glyphSet.rebuildContents()
+        # glyphs that aren't loaded may have changed on disk
+        self.destroyRepresentation("defcon.layer.componentReferences")
+        contents = glyphSet.contents
         # glyphs added since we started up
         addedGlyphs = []
-        for glyphName in set(self._glyphSet.keys()) - self._keys:
+        for glyphName in contents:
+            if glyphName in self._keys:
+                continue
             # not scheduled for deletion
-            if glyphName not in self._scheduledForDeletion:
+            elif glyphName not in self._scheduledForDeletion:
                 addedGlyphs.append(glyphName)
             # scheduled for deletion but not
             # what was scheduled for deletion.
@@ -619,19 +628,19 @@ class Layer(BaseObject):
                 if self._scheduledForDeletion[glyphName]["dataOnDisk"] != glyphSet.getGLIFModificationTime(glyphName):
                     addedGlyphs.append(glyphName)
         # glyphs deleted since we started up
-        deletedGlyphs = list(self._keys - set(glyphSet.keys()))
+        deletedGlyphs = [glyphName for glyphName in self._keys if glyphName not in contents]
         # glyphs modified since loading
         modifiedGlyphs = []
         for glyphName, glyph in self._glyphs.items():
             # deleted glyph. skip.
-            if glyphName not in glyphSet.contents:
+            if glyphName not in contents:
                 continue
             modTime = glyphSet.getGLIFModificationTime(glyphName)
             # mod time mismatch
             if modTime != glyph._dataOnDiskTimeStamp:
                 text = glyphSet.getGLIF(glyphName)
                 # data mismatch
-                if text != glyph._dataOnDisk:
+                if _makeDigest(text) != glyph._dataOnDisk:
                     modifiedGlyphs.append(glyphName)
         # add loaded glyphs to the keys
         for glyphName in addedGlyphs:
@@ -647,6 +656,9 @@ class Layer(BaseObject):
         """
         Reload the glyphs. This should not be called externally.
         """
+        # loading a glyph that wasn't loaded doesn't post
+        # Layer.Changed, so the references have to go here.
+        self.destroyRepresentation("defcon.layer.componentReferences")
         for glyphName in glyphNames:
             if glyphName not in self._glyphs:
                 self.loadGlyph(glyphName)
@@ -669,11 +681,11 @@ class Layer(BaseObject):
             for reference in componentReferences[glyphName]:
                 if reference in glyphNames:
                     continue
-                if reference not in self._glyphs:
-                    continue
                 if reference in referenceChanges:
                     continue
-                glyph = self._glyphs[reference]
+                glyph = self._glyphs.get(reference)
+                if glyph is None:
+                    continue
                 glyph.destroyAllRepresentations(None)
                 glyph.postNotification(notification=glyph.changeNotificationName)
                 referenceChanges.add(reference)
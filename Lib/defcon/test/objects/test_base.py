@@ -243,6 +243,32 @@ class BaseDictObjectTest(unittest.TestCase):
         self.assertFalse("A" in self.obj)
         self.assertTrue(self.obj.dirty)
 
+    def test_pop(self):
+        self.obj["A"] = 1
+        self.obj.dirty = False
+        self.assertEqual(self.obj.pop("B", None), None)
+        self.assertFalse(self.obj.dirty)
+        with self.assertRaises(KeyError):
+            self.obj.pop("B")
+        self.assertEqual(self.obj.pop("A"), 1)
+        self.assertFalse("A" in self.obj)
+        self.assertTrue(self.obj.dirty)
+
+    def test_pop_subclass_delItem(self):
+        deleted = []
+
+        class DeleteRecordingDictObject(BaseDictObject):
+
+            def __delitem__(self, key):
+                deleted.append(key)
+                super(DeleteRecordingDictObject, self).__delitem__(key)
+
+        obj = DeleteRecordingDictObject()
+        obj["A"] = 1
+        obj.pop("B", None)
+        self.assertEqual(obj.pop("A"), 1)
+        self.assertEqual(deleted, ["A"])
+
     def test_get(self):
         self.obj["A"] = 1
         self.assertEqual(self.obj.get("A"), 1)
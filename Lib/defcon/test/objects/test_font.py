@@ -3,6 +3,9 @@ import os
 import glob
 import tempfile
 import shutil
+import gc
+import sys
+import weakref
 import fs
 import fs.copy
 import fs.path
@@ -281,6 +284,28 @@ class FontTest(unittest.TestCase):
         layer = font.layers["test_layer"]
         self.assertTrue(layer.hasObserver(font, "Layer.GlyphAdded"))
 
+    def test_default_layer_change(self):
+        font = Font(getTestFontPath())
+        self.assertEqual(sorted(font.keys()), ["A", "B", "C"])
+        layer = font.layers["Layer 1"]
+        font.layers.defaultLayer = layer
+        self.assertIs(font._glyphSet, layer)
+        self.assertEqual(sorted(font.keys()), sorted(layer.keys()))
+
+    def test_default_layer_change_without_notifications(self):
+        font = Font(getTestFontPath())
+        layer = font.layers["Layer 1"]
+        font.dispatcher.disableNotifications()
+        font.layers.defaultLayer = layer
+        font.dispatcher.enableNotifications()
+        self.assertIs(font._glyphSet, layer)
+        font = Font(getTestFontPath())
+        layer = font.layers["Layer 1"]
+        font.dispatcher.holdNotifications()
+        font.layers.defaultLayer = layer
+        self.assertEqual(sorted(font.keys()), sorted(layer.keys()))
+        font.dispatcher.releaseHeldNotifications()
+
     def test_font_observes_loaded_layers(self):
         font = Font(getTestFontPath())
         for layername in font.layers.layerOrder:
@@ -303,6 +328,99 @@ class FontTest(unittest.TestCase):
         layer["B"].name = "Y"
         self.assertEqual(font.glyphOrder, ["A", "Y", "C"])
 
+    def test_released_without_cycle_collection(self):
+        # observers are held weakly by the notification center,
+        # so a loaded font must not be kept alive by its sub-objects.
+        gcEnabled = gc.isenabled()
+        gc.disable()
+        try:
+            font = Font(getTestFontPath())
+            font.info
+            font.kerning
+            font.groups
+            font.features
+            font.lib
+            font.images
+            font.data
+            font["A"].bounds
+            ref = weakref.ref(font)
+            del font
+            self.assertIsNone(ref())
+        finally:
+            if gcEnabled:
+                gc.enable()
+
+    def test_kerning_names_interned(self):
+        font = Font(getTestFontPath())
+        for first, second in font.kerning.keys():
+            self.assertIs(first, sys.intern(first))
+            self.assertIs(second, sys.intern(second))
+
+    def test_shared_reader(self):
+        font = Font(getTestFontPath())
+        reader = font._reader
+        font.info
+        font.kerning
+        font.features
+        font.lib
+        self.assertIs(font._reader, reader)
+        self.assertFalse(reader.fs.isclosed())
+
+    def test_getGlyphIndex(self):
+        font = Font(getTestFontPath())
+        self.assertIsNone(font.getGlyphIndex("A"))
+        font.glyphOrder = ["C", "A", "B", "A"]
+        self.assertEqual(font.getGlyphIndex("A"), 1)
+        self.assertEqual(font.getGlyphIndex("C"), 0)
+        self.assertIsNone(font.getGlyphIndex("X"))
+        self.assertEqual(font.getGlyphIndexes(["B", "X", "C"]), [2, None, 0])
+        font.newGlyph("X")
+        self.assertEqual(font.getGlyphIndex("X"), 4)
+        font.lib["public.glyphOrder"] = ["X"]
+        self.assertEqual(font.getGlyphIndex("X"), 0)
+        self.assertIsNone(font.getGlyphIndex("A"))
+
+    def test_getGlyphIndex_edited_in_place(self):
+        font = Font()
+        glyphOrder = ["a", "b", "c"]
+        font.glyphOrder = glyphOrder
+        self.assertEqual(font.getGlyphIndex("c"), 2)
+        font.lib["public.glyphOrder"].insert(0, "z")
+        self.assertEqual(font.getGlyphIndex("c"), 3)
+        self.assertEqual(font.getGlyphIndex("z"), 0)
+        font.lib["public.glyphOrder"].remove("a")
+        self.assertEqual(font.getGlyphIndexes(["a", "b", "c"]), [None, 1, 2])
+        # the list given to glyphOrder is the one stored in the lib
+        glyphOrder[1] = "y"
+        self.assertEqual(font.getGlyphIndex("y"), 1)
+        self.assertIsNone(font.getGlyphIndex("b"))
+
+    def test_updateGlyphOrder_edited_in_place(self):
+        font = Font()
+        for glyphName in "abcd":
+            font.newGlyph(glyphName)
+        font.lib["public.glyphOrder"].remove("a")
+        del font["c"]
+        self.assertEqual(font.glyphOrder, ["b", "d"])
+        font.lib["public.glyphOrder"].append("x")
+        font.newGlyph("x")
+        self.assertEqual(font.glyphOrder, ["b", "d", "x"])
+
+    def test_updateGlyphOrder_keeps_reverse_glyph_order(self):
+        font = Font()
+        for glyphName in "abcde":
+            font.newGlyph(glyphName)
+        self.assertEqual(font.getGlyphIndex("e"), 4)
+        reverseGlyphOrder = font._reverseGlyphOrder
+        del font["a"]
+        del font["c"]
+        font["b"].name = "x"
+        # deleting and renaming glyphs doesn't touch the map,
+        # it is only rebuilt when an index is asked for.
+        self.assertIs(font._reverseGlyphOrder, reverseGlyphOrder)
+        self.assertEqual(font.glyphOrder, ["x", "d", "e"])
+        self.assertEqual(font.getGlyphIndex("e"), 2)
+
     def test_updateGlyphOrder_none(self):
         font = Font(getTestFontPath())
         self.assertEqual(font.glyphOrder, [])
@@ -331,6 +449,17 @@ class FontTest(unittest.TestCase):
         font.updateGlyphOrder(addedGlyph="new", removedGlyph="B")
         self.assertEqual(font.glyphOrder, ["A", "new", "C"])
 
+    def test_updateGlyphOrder_batch_add(self):
+        font = Font()
+        names = ["glyph%d" % i for i in range(20)]
+        for name in names:
+            font.newGlyph(name)
+        self.assertEqual(font.glyphOrder, names)
+        self.assertEqual(font.getGlyphIndexes(names), list(range(20)))
+        font.updateGlyphOrder(removedGlyph="glyph0")
+        self.assertEqual(font.glyphOrder, names[1:])
+        self.assertEqual(font.getGlyphIndex("glyph1"), 0)
+
     def test_guidelines(self):
         font = Font(getTestFontPath())
         self.assertEqual(font.guidelines, [])
@@ -473,6 +602,20 @@ class FontTest(unittest.TestCase):
                 font.close()
                 tearDownTestFontCopy(path)
 
+    def test_save_glyph_changed_without_notifications(self):
+        path = makeTestFontCopy()
+        try:
+            font = Font(path)
+            glyph = font["A"]
+            glyph.disableNotifications()
+            glyph.width = 1234
+            glyph.enableNotifications()
+            self.assertTrue(glyph.dirty)
+            font.save()
+            self.assertEqual(Font(path)["A"].width, 1234)
+        finally:
+            tearDownTestFontCopy()
+
     def test_save_same_path_different_structure(self):
         for ufo in ("TestFont.ufo", "TestFont.ufoz"):
             path = makeTestFontCopy(getTestFontPath(ufo))
@@ -556,6 +699,52 @@ class FontTest(unittest.TestCase):
         self.assertEqual(font.ufoFormatVersion, 2)
         self.assertEqual(font.ufoFormatVersionTuple, (2, 0))
 
+    def test_ufo1_robofab_data_conversion(self):
+        with tempfile.TemporaryDirectory() as root:
+            path = os.path.join(root, "one.ufo")
+            font = Font()
+            font.info.postscriptBlueValues = [-10, 0, 500, 510]
+            font.info.postscriptStemSnapH = [80]
+            font.save(path, formatVersion=1)
+            font = Font(path)
+            self.assertEqual(font.info.postscriptBlueValues, [-10, 0, 500, 510])
+            self.assertEqual(font.info.postscriptStemSnapH, [80])
+            self.assertNotIn("org.robofab.postScriptHintData", font.lib)
+            font.close()
+            os.remove(os.path.join(path, "lib.plist"))
+            font = Font(path)
+            self.assertIsNone(font._features)
+            font.close()
+
+    def test_ufo2_kerning_conversion(self):
+        with tempfile.TemporaryDirectory() as root:
+            path = os.path.join(root, "two.ufo")
+            font = Font(getTestFontPath())
+            font.save(path, formatVersion=2)
+            font = Font(path)
+            self.assertEqual(font.kerning, Font(getTestFontPath()).kerning)
+            font.close()
+
+    def test_save_in_place_unloaded(self):
+        path = makeTestFontCopy()
+        try:
+            font = Font(path)
+            font.info.note = "changed"
+            font.save()
+            self.assertIsNone(font._groups)
+            self.assertIsNone(font._kerning)
+            self.assertIsNone(font._features)
+            self.assertIsNone(font._lib)
+            font = Font(path)
+            self.assertEqual(font.info.note, "changed")
+            original = Font(getTestFontPath())
+            self.assertEqual(font.groups, original.groups)
+            self.assertEqual(font.kerning, original.kerning)
+            self.assertEqual(font.features.text, original.features.text)
+            self.assertEqual(font.lib, original.lib)
+        finally:
+            tearDownTestFontCopy()
+
     def test_save_in_place_invalid_ufo(self):
         path = makeTestFontCopy()
         font = Font(path)
@@ -651,6 +840,7 @@ class FontTest(unittest.TestCase):
         self.assertEqual(info.ascender, 750)
         font.reloadInfo()
         self.assertEqual(info.ascender, 751)
+        self.assertNotIn("postNotification", vars(info))
 
         t = t.replace("<integer>751</integer>", "<integer>750</integer>")
         f = open(path, "w")
@@ -680,6 +870,20 @@ class FontTest(unittest.TestCase):
         f.write(t)
         f.close()
 
+    def test_reload_unchanged(self):
+        font = Font(getTestFontPath(u"TestExternalEditing.ufo"))
+        font.kerning
+        font.groups
+        font.lib.dirty = False
+        font.dirty = False
+        font.reloadKerning()
+        font.reloadGroups()
+        font.reloadLib()
+        self.assertFalse(font.kerning.dirty)
+        self.assertFalse(font.groups.dirty)
+        self.assertFalse(font.lib.dirty)
+        self.assertFalse(font.dirty)
+
     def test_reloadGroups(self):
         path = getTestFontPath(u"TestExternalEditing.ufo")
         font = Font(path)
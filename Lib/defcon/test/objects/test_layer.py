@@ -72,6 +72,13 @@ class LayerTest(unittest.TestCase):
                           ("B", "A"), ("B", "B"), ("B", "C"),
                           ("C", "A"), ("C", "B"), ("C", "C")])
 
+    def test_iter_delete(self):
+        font = Font(getTestFontPath())
+        layer = font.layers["public.default"]
+        for glyph in layer:
+            del layer[glyph.name]
+        self.assertEqual(len(layer), 0)
+
     def test_getitem(self):
         font = Font(getTestFontPath())
         layer = font.layers["public.default"]
@@ -144,6 +151,43 @@ class LayerTest(unittest.TestCase):
         self.assertEqual(sorted(layer.componentReferences.items()),
                          [("A", set(["C"])), ("B", set(["C"]))])
 
+    def test_componentReferences_after_change(self):
+        font = Font(getTestFontPath())
+        layer = font.layers["public.default"]
+        self.assertEqual(layer.componentReferences["A"], set(["C"]))
+        glyph = layer.newGlyph("D")
+        glyph.appendComponent(glyph.componentClass())
+        glyph.components[0].baseGlyph = "A"
+        self.assertEqual(layer.componentReferences["A"], set(["C", "D"]))
+        del layer["D"]
+        self.assertEqual(layer.componentReferences["A"], set(["C"]))
+
+    def test_componentReferences_read_only(self):
+        font = Font(getTestFontPath())
+        layer = font.layers["public.default"]
+        references = layer.componentReferences
+        with self.assertRaises(TypeError):
+            references["X"] = set()
+        with self.assertRaises(AttributeError):
+            references["A"].add("X")
+
+    def test_componentReferences_after_reload(self):
+        path = makeTestFontCopy()
+        try:
+            font = Font(path)
+            layer = font.layers["public.default"]
+            self.assertEqual(layer.componentReferences["A"], set(["C"]))
+            self.assertNotIn("B", layer._glyphs)
+            other = Font(path)
+            glyph = other["B"]
+            glyph.appendComponent(glyph.componentClass())
+            glyph.components[0].baseGlyph = "A"
+            other.save()
+            font.reloadGlyphs(["B"])
+            self.assertEqual(layer.componentReferences["A"], set(["B", "C"]))
+        finally:
+            tearDownTestFontCopy()
+
     def test_imageReferences(self):
         font = Font(getTestFontPath())
         layer = font.layers["Layer 1"]
@@ -166,6 +210,24 @@ class LayerTest(unittest.TestCase):
         layer = font.layers["public.default"]
         self.assertEqual(layer.controlPointBounds, (0, 0, 700, 700))
 
+    def test_bounds_after_change(self):
+        font = Font(getTestFontPath())
+        layer = font.layers["public.default"]
+        self.assertEqual(layer.bounds, (0, 0, 700, 700))
+        self.assertEqual(layer.controlPointBounds, (0, 0, 700, 700))
+        layer["A"].move((100, 50))
+        self.assertEqual(layer.bounds, (0, 0, 800, 750))
+        self.assertEqual(layer.controlPointBounds, (0, 0, 800, 750))
+        glyph = layer.newGlyph("X")
+        pen = glyph.getPen()
+        pen.moveTo((-10, -20))
+        pen.lineTo((0, 0))
+        pen.lineTo((-10, 0))
+        pen.closePath()
+        self.assertEqual(layer.bounds, (-10, -20, 800, 750))
+        del layer["X"]
+        self.assertEqual(layer.bounds, (0, 0, 800, 750))
+
     def test_lib(self):
         font = Font(getTestFontPath())
         layer = font.layers["Layer 1"]
@@ -1,4 +1,5 @@
 from __future__ import absolute_import
+from types import MappingProxyType
 from fontTools.pens.areaPen import AreaPen
 from fontTools.pens.boundsPen import ControlBoundsPen, BoundsPen
 from fontTools.misc.arrayTools import unionRect
@@ -96,3 +97,34 @@ def componentPointBoundsRepresentationFactory(obj):
     pen = ControlBoundsPen(obj.layer)
     obj.draw(pen)
     return pen.bounds
+
+# -----
+# Layer
+# -----
+
+# bounds
+
+def layerBoundsRepresentationFactory(layer):
+    return _unionGlyphRects(layer, "bounds")
+
+def layerControlPointBoundsRepresentationFactory(layer):
+    return _unionGlyphRects(layer, "controlPointBounds")
+
+def _unionGlyphRects(layer, attr):
+    fontRect = None
+    for glyph in layer:
+        glyphRect = getattr(glyph, attr)
+        if glyphRect is None:
+            continue
+        if fontRect is None:
+            fontRect = glyphRect
+        else:
+            fontRect = unionRect(fontRect, glyphRect)
+    return fontRect
+
+# component references
+
+def layerComponentReferencesRepresentationFactory(layer):
+    # the result is shared by everyone asking for it, so make it read-only
+    references = layer._findComponentReferences()
+    return MappingProxyType({baseGlyph: frozenset(glyphNames) for baseGlyph, glyphNames in references.items()})